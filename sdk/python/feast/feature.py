@@ -29,6 +29,10 @@ class Feature:
         labels (optional): User-defined metadata in dictionary form.
     """
 
+    # Registries can hold many Feature objects; slots avoid a per-instance
+    # __dict__ and make attribute access an offset fetch instead of a dict lookup.
+    __slots__ = ("_name", "_dtype", "_description", "_labels")
+
     def __init__(
         self,
         name: str,
@@ -786,7 +786,7 @@ class FeatureStore:
             if
             (
                 # BFVs are not handled separately from FVs right now.
-                (isinstance(ob, FeatureView) or isinstance(ob, BatchFeatureView))
+                isinstance(ob, (FeatureView, BatchFeatureView))
                 and not isinstance(ob, StreamFeatureView)
             )
         ]
@@ -867,7 +867,7 @@ class FeatureStore:
                 ob
                 for ob in objects_to_delete
                 if (
-                    (isinstance(ob, FeatureView) or isinstance(ob, BatchFeatureView))
+                    isinstance(ob, (FeatureView, BatchFeatureView))
                     and not isinstance(ob, StreamFeatureView)
                 )
             ]
@@ -18,6 +18,19 @@ from feast.stream_feature_view import StreamFeatureView
 from feast.types import String
 from feast.value_type import ValueType
 
+# Double underscores often signal an internal-use column.
+_INTERNAL_COLUMN_NAME_PATTERN = re.compile("^__|__$")
+
+# Timestamp column type patterns by data source type, compiled once at import so
+# that resolving a source's pattern is a dict lookup instead of an if/elif chain.
+_TS_COLUMN_TYPE_PATTERNS = {
+    FileSource: re.compile(r"^timestamp"),
+    BigQuerySource: re.compile("TIMESTAMP|DATETIME"),
+    RedshiftSource: re.compile("TIMESTAMP[A-Z]*"),
+    SnowflakeSource: re.compile("TIMESTAMP_[A-Z]*"),
+    MsSqlServerSource: re.compile("TIMESTAMP|DATETIME"),
+}
+
 
 def update_data_sources_with_inferred_event_timestamp_col(
     data_sources: List[DataSource], config: RepoConfig
@@ -30,22 +43,20 @@ def update_data_sources_with_inferred_event_timestamp_col(
             data_source = data_source.batch_source
         if data_source.timestamp_field is None or data_source.timestamp_field == "":
             # prepare right match pattern for data source
-            ts_column_type_regex_pattern: str
+            ts_column_type_regex: Optional[re.Pattern] = None
             # TODO(adchia): Move Spark source inference out of this logic
-            if (
-                isinstance(data_source, FileSource)
-                or "SparkSource" == data_source.__class__.__name__
-            ):
-                ts_column_type_regex_pattern = r"^timestamp"
-            elif isinstance(data_source, BigQuerySource):
-                ts_column_type_regex_pattern = "TIMESTAMP|DATETIME"
-            elif isinstance(data_source, RedshiftSource):
-                ts_column_type_regex_pattern = "TIMESTAMP[A-Z]*"
-            elif isinstance(data_source, SnowflakeSource):
-                ts_column_type_regex_pattern = "TIMESTAMP_[A-Z]*"
-            elif isinstance(data_source, MsSqlServerSource):
-                ts_column_type_regex_pattern = "TIMESTAMP|DATETIME"
+            if "SparkSource" == data_source.__class__.__name__:
+                ts_column_type_regex = _TS_COLUMN_TYPE_PATTERNS[FileSource]
             else:
+                ts_column_type_regex = _TS_COLUMN_TYPE_PATTERNS.get(type(data_source))
+                if ts_column_type_regex is None:
+                    # Fall back to an isinstance scan for subclasses of the
+                    # supported data source types.
+                    for source_type, pattern in _TS_COLUMN_TYPE_PATTERNS.items():
+                        if isinstance(data_source, source_type):
+                            ts_column_type_regex = pattern
+                            break
+            if ts_column_type_regex is None:
                 raise RegistryInferenceFailure(
                     "DataSource",
                     f"""
@@ -54,15 +65,6 @@ def update_data_sources_with_inferred_event_timestamp_col(
                     Attempting to infer from {data_source}.
                     """,
                 )
-            #  for informing the type checker
-            assert (
-                isinstance(data_source, FileSource)
-                or isinstance(data_source, BigQuerySource)
-                or isinstance(data_source, RedshiftSource)
-                or isinstance(data_source, SnowflakeSource)
-                or isinstance(data_source, MsSqlServerSource)
-                or "SparkSource" == data_source.__class__.__name__
-            )
 
             # loop through table columns to find singular match
             timestamp_fields = []
@@ -70,7 +72,7 @@ def update_data_sources_with_inferred_event_timestamp_col(
                 col_name,
                 col_datatype,
             ) in data_source.get_table_column_names_and_types(config):
-                if re.match(ts_column_type_regex_pattern, col_datatype):
+                if ts_column_type_regex.match(col_datatype):
                     timestamp_fields.append(col_name)
 
             if len(timestamp_fields) > 1:
@@ -78,7 +80,7 @@ def update_data_sources_with_inferred_event_timestamp_col(
                     "DataSource",
                     f"""{ERROR_MSG_PREFIX}; found multiple possible columns of timestamp type.
                     Data source type: {data_source.__class__.__name__},
-                    Timestamp regex: `{ts_column_type_regex_pattern}`, columns: {timestamp_fields}""",
+                    Timestamp regex: `{ts_column_type_regex.pattern}`, columns: {timestamp_fields}""",
                 )
             elif len(timestamp_fields) == 1:
                 data_source.timestamp_field = timestamp_fields[0]
@@ -88,7 +90,7 @@ def update_data_sources_with_inferred_event_timestamp_col(
                     f"""
                     {ERROR_MSG_PREFIX}; Found no columns of timestamp type.
                     Data source type: {data_source.__class__.__name__},
-                    Timestamp regex: `{ts_column_type_regex_pattern}`.
+                    Timestamp regex: `{ts_column_type_regex.pattern}`.
                     """,
                 )
 
@@ -126,17 +128,22 @@ def update_feature_views_with_inferred_features_and_entities(
         )
 
         # Fields whose names match a join key are considered to be entity columns; all
-        # other fields are considered to be feature columns.
+        # other fields are considered to be feature columns. Track the names in sets
+        # rather than rebuilding a list of names on every iteration.
+        entity_column_names = {
+            entity_column.name for entity_column in fv.entity_columns
+        }
+        feature_names = {feature.name for feature in fv.features}
         for field in fv.schema:
             if field.name in join_keys:
                 # Do not override a preexisting field with the same name.
-                if field.name not in [
-                    entity_column.name for entity_column in fv.entity_columns
-                ]:
+                if field.name not in entity_column_names:
                     fv.entity_columns.append(field)
+                    entity_column_names.add(field.name)
             else:
-                if field.name not in [feature.name for feature in fv.features]:
+                if field.name not in feature_names:
                     fv.features.append(field)
+                    feature_names.add(field.name)
 
         # Respect the `value_type` attribute of the entity, if it is specified.
         for entity_name in fv.entities:
@@ -145,8 +152,7 @@ def update_feature_views_with_inferred_features_and_entities(
             if entity is None:
                 continue
             if (
-                entity.join_key
-                not in [entity_column.name for entity_column in fv.entity_columns]
+                entity.join_key not in entity_column_names
                 and entity.value_type != ValueType.UNKNOWN
             ):
                 fv.entity_columns.append(
@@ -155,6 +161,7 @@ def update_feature_views_with_inferred_features_and_entities(
                         dtype=from_value_type(entity.value_type),
                     )
                 )
+                entity_column_names.add(entity.join_key)
 
         # Infer a dummy entity column for entityless feature views.
         if (
@@ -213,6 +220,8 @@ def _infer_features_and_entities(
         config
     )
 
+    entity_column_names = {entity_column.name for entity_column in fv.entity_columns}
+    feature_names = {feature.name for feature in fv.features}
     for col_name, col_datatype in table_column_names_and_types:
         if col_name in columns_to_exclude:
             continue
@@ -223,13 +232,10 @@ def _infer_features_and_entities(
                     fv.batch_source.source_datatype_to_feast_value_type()(col_datatype)
                 ),
             )
-            if field.name not in [
-                entity_column.name for entity_column in fv.entity_columns
-            ]:
+            if field.name not in entity_column_names:
                 fv.entity_columns.append(field)
-        elif not re.match(
-            "^__|__$", col_name
-        ):  # double underscores often signal an internal-use column
+                entity_column_names.add(field.name)
+        elif not _INTERNAL_COLUMN_NAME_PATTERN.match(col_name):
             if run_inference_for_features:
                 feature_name = (
                     fv.batch_source.field_mapping[col_name]
@@ -244,5 +250,6 @@ def _infer_features_and_entities(
                         )
                     ),
                 )
-                if field.name not in [feature.name for feature in fv.features]:
+                if field.name not in feature_names:
                     fv.features.append(field)
+                    feature_names.add(field.name)
@@ -467,7 +467,7 @@ def _get_entity_df_event_timestamp_range(
             entity_df_event_timestamp.min().to_pydatetime(),
             entity_df_event_timestamp.max().to_pydatetime(),
         )
-    elif isinstance(entity_df, str) or isinstance(entity_df, pyspark.sql.DataFrame):
+    elif isinstance(entity_df, (str, pyspark.sql.DataFrame)):
         # If the entity_df is a string (SQL query), determine range
         # from table
         if isinstance(entity_df, str):
@@ -494,7 +494,7 @@ def _get_entity_schema(
 ) -> Dict[str, np.dtype]:
     if isinstance(entity_df, pd.DataFrame):
         return dict(zip(entity_df.columns, entity_df.dtypes))
-    elif isinstance(entity_df, str) or isinstance(entity_df, pyspark.sql.DataFrame):
+    elif isinstance(entity_df, (str, pyspark.sql.DataFrame)):
         if isinstance(entity_df, str):
             entity_spark_df = spark_session.sql(entity_df)
         else:
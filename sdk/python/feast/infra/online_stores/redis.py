@@ -110,7 +110,9 @@ class RedisOnlineStore(OnlineStore):
                 deleted_count += 1
             pipe.execute()
 
-        logger.debug(f"Deleted {deleted_count} rows for entity {', '.join(join_keys)}")
+        logger.debug(
+            "Deleted %d rows for entity %s", deleted_count, ", ".join(join_keys)
+        )
 
     def delete_table(self, config: RepoConfig, table: FeatureView):
         """
@@ -143,7 +145,7 @@ class RedisOnlineStore(OnlineStore):
                 deleted_count += 1
             pipe.execute()
 
-        logger.debug(f"Deleted {deleted_count} rows for feature view {table.name}")
+        logger.debug("Deleted %d rows for feature view %s", deleted_count, table.name)
 
     def update(
         self,
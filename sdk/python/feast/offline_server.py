@@ -71,24 +71,24 @@ class OfflineServer(fl.FlightServerBase):
         command = json.loads(key[1])
         if "api" in command:
             data = reader.read_all()
-            logger.debug(f"do_put: command is{command}, data is {data}")
+            logger.debug("do_put: command is%s, data is %s", command, data)
             self.flights[key] = data
 
             self._call_api(command, key)
         else:
-            logger.warning(f"No 'api' field in command: {command}")
+            logger.warning("No 'api' field in command: %s", command)
 
     def _call_api(self, command: dict, key: str):
         remove_data = False
         try:
             api = command["api"]
-            if api == OfflineServer.offline_write_batch.__name__:
+            if api == _OFFLINE_WRITE_BATCH:
                 self.offline_write_batch(command, key)
                 remove_data = True
-            elif api == OfflineServer.write_logged_features.__name__:
+            elif api == _WRITE_LOGGED_FEATURES:
                 self.write_logged_features(command, key)
                 remove_data = True
-            elif api == OfflineServer.persist.__name__:
+            elif api == _PERSIST:
                 self.persist(command["retrieve_func"], command, key)
                 remove_data = True
         except Exception as e:
@@ -160,14 +160,14 @@ class OfflineServer(fl.FlightServerBase):
 
         command = json.loads(key[1])
         api = command["api"]
-        logger.debug(f"get command is {command}")
-        logger.debug(f"requested api is {api}")
+        logger.debug("get command is %s", command)
+        logger.debug("requested api is %s", api)
         try:
-            if api == OfflineServer.get_historical_features.__name__:
+            if api == _GET_HISTORICAL_FEATURES:
                 table = self.get_historical_features(command, key).to_arrow()
-            elif api == OfflineServer.pull_all_from_table_or_query.__name__:
+            elif api == _PULL_ALL_FROM_TABLE_OR_QUERY:
                 table = self.pull_all_from_table_or_query(command).to_arrow()
-            elif api == OfflineServer.pull_latest_from_table_or_query.__name__:
+            elif api == _PULL_LATEST_FROM_TABLE_OR_QUERY:
                 table = self.pull_latest_from_table_or_query(command).to_arrow()
             else:
                 raise NotImplementedError
@@ -244,15 +244,15 @@ class OfflineServer(fl.FlightServerBase):
     def list_actions(self, context):
         return [
             (
-                OfflineServer.offline_write_batch.__name__,
+                _OFFLINE_WRITE_BATCH,
                 "Writes the specified arrow table to the data source underlying the specified feature view.",
             ),
             (
-                OfflineServer.write_logged_features.__name__,
+                _WRITE_LOGGED_FEATURES,
                 "Writes logged features to a specified destination in the offline store.",
             ),
             (
-                OfflineServer.persist.__name__,
+                _PERSIST,
                 "Synchronously executes the underlying query and persists the result in the same offline store at the "
                 "specified destination.",
             ),
@@ -285,13 +285,11 @@ class OfflineServer(fl.FlightServerBase):
 
     def persist(self, retrieve_func: str, command: dict, key: str):
         try:
-            if retrieve_func == OfflineServer.get_historical_features.__name__:
+            if retrieve_func == _GET_HISTORICAL_FEATURES:
                 ret_job = self.get_historical_features(command, key)
-            elif (
-                retrieve_func == OfflineServer.pull_latest_from_table_or_query.__name__
-            ):
+            elif retrieve_func == _PULL_LATEST_FROM_TABLE_OR_QUERY:
                 ret_job = self.pull_latest_from_table_or_query(command)
-            elif retrieve_func == OfflineServer.pull_all_from_table_or_query.__name__:
+            elif retrieve_func == _PULL_ALL_FROM_TABLE_OR_QUERY:
                 ret_job = self.pull_all_from_table_or_query(command)
             else:
                 raise NotImplementedError
@@ -311,6 +309,18 @@ class OfflineServer(fl.FlightServerBase):
         pass
 
 
+# The API names clients put in their commands are the OfflineServer method
+# names; resolve them once here instead of re-reading __name__ per request.
+_OFFLINE_WRITE_BATCH = OfflineServer.offline_write_batch.__name__
+_WRITE_LOGGED_FEATURES = OfflineServer.write_logged_features.__name__
+_PERSIST = OfflineServer.persist.__name__
+_GET_HISTORICAL_FEATURES = OfflineServer.get_historical_features.__name__
+_PULL_ALL_FROM_TABLE_OR_QUERY = OfflineServer.pull_all_from_table_or_query.__name__
+_PULL_LATEST_FROM_TABLE_OR_QUERY = (
+    OfflineServer.pull_latest_from_table_or_query.__name__
+)
+
+
 def remove_dummies(fv: FeatureView) -> FeatureView:
     """
     Removes dummmy IDs from FeatureView instances created with FeatureView.from_proto
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import json
 import logging
 from collections import defaultdict
@@ -56,6 +57,51 @@ NULL_TIMESTAMP_INT_VALUE: int = np.datetime64("NaT").astype(int)
 
 logger = logging.getLogger(__name__)
 
+# Built once at import so that per-value type inference is a single dict lookup.
+PYTHON_TYPE_NAME_TO_FEAST_VALUE_TYPE: Dict[str, ValueType] = {
+    "int": ValueType.INT64,
+    "str": ValueType.STRING,
+    "string": ValueType.STRING,  # pandas.StringDtype
+    "float": ValueType.DOUBLE,
+    "bytes": ValueType.BYTES,
+    "float64": ValueType.DOUBLE,
+    "float32": ValueType.FLOAT,
+    "int64": ValueType.INT64,
+    "uint64": ValueType.INT64,
+    "int32": ValueType.INT32,
+    "uint32": ValueType.INT32,
+    "int16": ValueType.INT32,
+    "uint16": ValueType.INT32,
+    "uint8": ValueType.INT32,
+    "int8": ValueType.INT32,
+    "bool": ValueType.BOOL,
+    "boolean": ValueType.BOOL,
+    "timedelta": ValueType.UNIX_TIMESTAMP,
+    "timestamp": ValueType.UNIX_TIMESTAMP,
+    "datetime": ValueType.UNIX_TIMESTAMP,
+    "datetime64[ns]": ValueType.UNIX_TIMESTAMP,
+    "datetime64[ns, tz]": ValueType.UNIX_TIMESTAMP,
+    "category": ValueType.STRING,
+}
+
+PROTO_VALUE_FIELD_TO_FEAST_VALUE_TYPE: Dict[Optional[str], ValueType] = {
+    "int32_val": ValueType.INT32,
+    "int64_val": ValueType.INT64,
+    "double_val": ValueType.DOUBLE,
+    "float_val": ValueType.FLOAT,
+    "string_val": ValueType.STRING,
+    "bytes_val": ValueType.BYTES,
+    "bool_val": ValueType.BOOL,
+    "int32_list_val": ValueType.INT32_LIST,
+    "int64_list_val": ValueType.INT64_LIST,
+    "double_list_val": ValueType.DOUBLE_LIST,
+    "float_list_val": ValueType.FLOAT_LIST,
+    "string_list_val": ValueType.STRING_LIST,
+    "bytes_list_val": ValueType.BYTES_LIST,
+    "bool_list_val": ValueType.BOOL_LIST,
+    None: ValueType.NULL,
+}
+
 
 def feast_value_type_to_python_type(field_value_proto: ProtoValue) -> Any:
     """
@@ -73,8 +119,9 @@ def feast_value_type_to_python_type(field_value_proto: ProtoValue) -> Any:
         return None
     val = getattr(field_value_proto, val_attr)
 
-    # If it's a _LIST type extract the list.
-    if hasattr(val, "val"):
+    # If it's a _LIST type extract the list. The oneof field name tells us the
+    # shape directly, so there is no need to introspect the value with hasattr.
+    if val_attr.endswith("_list_val"):
         val = list(val.val)
 
     # Convert UNIX_TIMESTAMP values to `datetime`
@@ -97,17 +144,20 @@ def feast_value_type_to_python_type(field_value_proto: ProtoValue) -> Any:
     return val
 
 
+FEAST_VALUE_TYPE_TO_PANDAS_TYPE: Dict[ValueType, str] = {
+    ValueType.FLOAT: "float",
+    ValueType.INT32: "int",
+    ValueType.INT64: "int",
+    ValueType.STRING: "str",
+    ValueType.DOUBLE: "float",
+    ValueType.BYTES: "bytes",
+    ValueType.BOOL: "bool",
+    ValueType.UNIX_TIMESTAMP: "datetime64[ns]",
+}
+
+
 def feast_value_type_to_pandas_type(value_type: ValueType) -> Any:
-    value_type_to_pandas_type: Dict[ValueType, str] = {
-        ValueType.FLOAT: "float",
-        ValueType.INT32: "int",
-        ValueType.INT64: "int",
-        ValueType.STRING: "str",
-        ValueType.DOUBLE: "float",
-        ValueType.BYTES: "bytes",
-        ValueType.BOOL: "bool",
-        ValueType.UNIX_TIMESTAMP: "datetime64[ns]",
-    }
+    value_type_to_pandas_type = FEAST_VALUE_TYPE_TO_PANDAS_TYPE
     if value_type.name.endswith("_LIST"):
         return "object"
     if value_type in value_type_to_pandas_type:
@@ -139,31 +189,7 @@ def python_type_to_feast_value_type(
     """
     type_name = (type_name or type(value).__name__).lower()
 
-    type_map = {
-        "int": ValueType.INT64,
-        "str": ValueType.STRING,
-        "string": ValueType.STRING,  # pandas.StringDtype
-        "float": ValueType.DOUBLE,
-        "bytes": ValueType.BYTES,
-        "float64": ValueType.DOUBLE,
-        "float32": ValueType.FLOAT,
-        "int64": ValueType.INT64,
-        "uint64": ValueType.INT64,
-        "int32": ValueType.INT32,
-        "uint32": ValueType.INT32,
-        "int16": ValueType.INT32,
-        "uint16": ValueType.INT32,
-        "uint8": ValueType.INT32,
-        "int8": ValueType.INT32,
-        "bool": ValueType.BOOL,
-        "boolean": ValueType.BOOL,
-        "timedelta": ValueType.UNIX_TIMESTAMP,
-        "timestamp": ValueType.UNIX_TIMESTAMP,
-        "datetime": ValueType.UNIX_TIMESTAMP,
-        "datetime64[ns]": ValueType.UNIX_TIMESTAMP,
-        "datetime64[ns, tz]": ValueType.UNIX_TIMESTAMP,
-        "category": ValueType.STRING,
-    }
+    type_map = PYTHON_TYPE_NAME_TO_FEAST_VALUE_TYPE
 
     if type_name in type_map:
         return type_map[type_name]
@@ -241,28 +267,30 @@ def python_values_to_feast_value_type(
     return inferred_dtype
 
 
+VALUE_TYPE_STR_TO_FEAST_VALUE_TYPE: Dict[str, ValueType] = {
+    "UNKNOWN": ValueType.UNKNOWN,
+    "BYTES": ValueType.BYTES,
+    "STRING": ValueType.STRING,
+    "INT32": ValueType.INT32,
+    "INT64": ValueType.INT64,
+    "DOUBLE": ValueType.DOUBLE,
+    "FLOAT": ValueType.FLOAT,
+    "BOOL": ValueType.BOOL,
+    "NULL": ValueType.NULL,
+    "UNIX_TIMESTAMP": ValueType.UNIX_TIMESTAMP,
+    "BYTES_LIST": ValueType.BYTES_LIST,
+    "STRING_LIST": ValueType.STRING_LIST,
+    "INT32_LIST ": ValueType.INT32_LIST,
+    "INT64_LIST": ValueType.INT64_LIST,
+    "DOUBLE_LIST": ValueType.DOUBLE_LIST,
+    "FLOAT_LIST": ValueType.FLOAT_LIST,
+    "BOOL_LIST": ValueType.BOOL_LIST,
+    "UNIX_TIMESTAMP_LIST": ValueType.UNIX_TIMESTAMP_LIST,
+}
+
+
 def _convert_value_type_str_to_value_type(type_str: str) -> ValueType:
-    type_map = {
-        "UNKNOWN": ValueType.UNKNOWN,
-        "BYTES": ValueType.BYTES,
-        "STRING": ValueType.STRING,
-        "INT32": ValueType.INT32,
-        "INT64": ValueType.INT64,
-        "DOUBLE": ValueType.DOUBLE,
-        "FLOAT": ValueType.FLOAT,
-        "BOOL": ValueType.BOOL,
-        "NULL": ValueType.NULL,
-        "UNIX_TIMESTAMP": ValueType.UNIX_TIMESTAMP,
-        "BYTES_LIST": ValueType.BYTES_LIST,
-        "STRING_LIST": ValueType.STRING_LIST,
-        "INT32_LIST ": ValueType.INT32_LIST,
-        "INT64_LIST": ValueType.INT64_LIST,
-        "DOUBLE_LIST": ValueType.DOUBLE_LIST,
-        "FLOAT_LIST": ValueType.FLOAT_LIST,
-        "BOOL_LIST": ValueType.BOOL_LIST,
-        "UNIX_TIMESTAMP_LIST": ValueType.UNIX_TIMESTAMP_LIST,
-    }
-    return type_map[type_str]
+    return VALUE_TYPE_STR_TO_FEAST_VALUE_TYPE[type_str]
 
 
 def _type_err(item, dtype):
@@ -513,25 +541,19 @@ def _proto_value_to_value_type(proto_value: ProtoValue) -> ValueType:
         A variant of ValueType.
     """
     proto_str = proto_value.WhichOneof("val")
-    type_map = {
-        "int32_val": ValueType.INT32,
-        "int64_val": ValueType.INT64,
-        "double_val": ValueType.DOUBLE,
-        "float_val": ValueType.FLOAT,
-        "string_val": ValueType.STRING,
-        "bytes_val": ValueType.BYTES,
-        "bool_val": ValueType.BOOL,
-        "int32_list_val": ValueType.INT32_LIST,
-        "int64_list_val": ValueType.INT64_LIST,
-        "double_list_val": ValueType.DOUBLE_LIST,
-        "float_list_val": ValueType.FLOAT_LIST,
-        "string_list_val": ValueType.STRING_LIST,
-        "bytes_list_val": ValueType.BYTES_LIST,
-        "bool_list_val": ValueType.BOOL_LIST,
-        None: ValueType.NULL,
-    }
-
-    return type_map[proto_str]
+    return PROTO_VALUE_FIELD_TO_FEAST_VALUE_TYPE[proto_str]
+
+
+PA_TYPE_STR_TO_FEAST_VALUE_TYPE: Dict[str, ValueType] = {
+    "int32": ValueType.INT32,
+    "int64": ValueType.INT64,
+    "double": ValueType.DOUBLE,
+    "float": ValueType.FLOAT,
+    "string": ValueType.STRING,
+    "binary": ValueType.BYTES,
+    "bool": ValueType.BOOL,
+    "null": ValueType.NULL,
+}
 
 
 def pa_to_feast_value_type(pa_type_as_str: str) -> ValueType:
@@ -543,17 +565,7 @@ def pa_to_feast_value_type(pa_type_as_str: str) -> ValueType:
     if pa_type_as_str.startswith("timestamp"):
         value_type = ValueType.UNIX_TIMESTAMP
     else:
-        type_map = {
-            "int32": ValueType.INT32,
-            "int64": ValueType.INT64,
-            "double": ValueType.DOUBLE,
-            "float": ValueType.FLOAT,
-            "string": ValueType.STRING,
-            "binary": ValueType.BYTES,
-            "bool": ValueType.BOOL,
-            "null": ValueType.NULL,
-        }
-        value_type = type_map[pa_type_as_str]
+        value_type = PA_TYPE_STR_TO_FEAST_VALUE_TYPE[pa_type_as_str]
 
     if is_list:
         value_type = ValueType[value_type.name + "_LIST"]
@@ -561,28 +573,29 @@ def pa_to_feast_value_type(pa_type_as_str: str) -> ValueType:
     return value_type
 
 
+BQ_TYPE_TO_FEAST_VALUE_TYPE: Dict[str, ValueType] = {
+    "DATETIME": ValueType.UNIX_TIMESTAMP,
+    "TIMESTAMP": ValueType.UNIX_TIMESTAMP,
+    "INTEGER": ValueType.INT64,
+    "NUMERIC": ValueType.INT64,
+    "INT64": ValueType.INT64,
+    "STRING": ValueType.STRING,
+    "FLOAT": ValueType.DOUBLE,
+    "FLOAT64": ValueType.DOUBLE,
+    "BYTES": ValueType.BYTES,
+    "BOOL": ValueType.BOOL,
+    "BOOLEAN": ValueType.BOOL,  # legacy sql data type
+    "NULL": ValueType.NULL,
+}
+
+
 def bq_to_feast_value_type(bq_type_as_str: str) -> ValueType:
     is_list = False
     if bq_type_as_str.startswith("ARRAY<"):
         is_list = True
         bq_type_as_str = bq_type_as_str[6:-1]
 
-    type_map: Dict[str, ValueType] = {
-        "DATETIME": ValueType.UNIX_TIMESTAMP,
-        "TIMESTAMP": ValueType.UNIX_TIMESTAMP,
-        "INTEGER": ValueType.INT64,
-        "NUMERIC": ValueType.INT64,
-        "INT64": ValueType.INT64,
-        "STRING": ValueType.STRING,
-        "FLOAT": ValueType.DOUBLE,
-        "FLOAT64": ValueType.DOUBLE,
-        "BYTES": ValueType.BYTES,
-        "BOOL": ValueType.BOOL,
-        "BOOLEAN": ValueType.BOOL,  # legacy sql data type
-        "NULL": ValueType.NULL,
-    }
-
-    value_type = type_map.get(bq_type_as_str, ValueType.STRING)
+    value_type = BQ_TYPE_TO_FEAST_VALUE_TYPE.get(bq_type_as_str, ValueType.STRING)
 
     if is_list:
         value_type = ValueType[value_type.name + "_LIST"]
@@ -590,29 +603,53 @@ def bq_to_feast_value_type(bq_type_as_str: str) -> ValueType:
     return value_type
 
 
+MSSQL_TYPE_TO_FEAST_VALUE_TYPE: Dict[str, ValueType] = {
+    "bigint": ValueType.FLOAT,
+    "binary": ValueType.BYTES,
+    "bit": ValueType.BOOL,
+    "char": ValueType.STRING,
+    "date": ValueType.UNIX_TIMESTAMP,
+    "datetime": ValueType.UNIX_TIMESTAMP,
+    "float": ValueType.FLOAT,
+    "nchar": ValueType.STRING,
+    "nvarchar": ValueType.STRING,
+    "nvarchar(max)": ValueType.STRING,
+    "real": ValueType.FLOAT,
+    "smallint": ValueType.INT32,
+    "tinyint": ValueType.INT32,
+    "varbinary": ValueType.BYTES,
+    "varchar": ValueType.STRING,
+    "None": ValueType.NULL,
+    # skip date, geometry, hllsketch, time, timetz
+}
+
+
 def mssql_to_feast_value_type(mssql_type_as_str: str) -> ValueType:
-    type_map = {
-        "bigint": ValueType.FLOAT,
-        "binary": ValueType.BYTES,
-        "bit": ValueType.BOOL,
-        "char": ValueType.STRING,
-        "date": ValueType.UNIX_TIMESTAMP,
-        "datetime": ValueType.UNIX_TIMESTAMP,
-        "float": ValueType.FLOAT,
-        "nchar": ValueType.STRING,
-        "nvarchar": ValueType.STRING,
-        "nvarchar(max)": ValueType.STRING,
-        "real": ValueType.FLOAT,
-        "smallint": ValueType.INT32,
-        "tinyint": ValueType.INT32,
-        "varbinary": ValueType.BYTES,
-        "varchar": ValueType.STRING,
-        "None": ValueType.NULL,
-        # skip date, geometry, hllsketch, time, timetz
-    }
-    if mssql_type_as_str.lower() not in type_map:
+    value_type = MSSQL_TYPE_TO_FEAST_VALUE_TYPE.get(mssql_type_as_str.lower())
+    if value_type is None:
         raise ValueError(f"Mssql type not supported by feast {mssql_type_as_str}")
-    return type_map[mssql_type_as_str.lower()]
+    return value_type
+
+
+# We have to take into account how arrow types map to parquet types as well.
+# For example, null type maps to int32 in parquet, so we have to use int4 in Redshift.
+# Other mappings have also been adjusted accordingly.
+PA_TYPE_STR_TO_MSSQL_TYPE: Dict[str, str] = {
+    "null": "None",
+    "bool": "bit",
+    "int8": "tinyint",
+    "int16": "smallint",
+    "int32": "int",
+    "int64": "bigint",
+    "uint8": "tinyint",
+    "uint16": "smallint",
+    "uint32": "int",
+    "uint64": "bigint",
+    "float": "float",
+    "double": "real",
+    "binary": "binary",
+    "string": "varchar",
+}
 
 
 def pa_to_mssql_type(pa_type: "pyarrow.DataType") -> str:
@@ -631,69 +668,52 @@ def pa_to_mssql_type(pa_type: "pyarrow.DataType") -> str:
     if pa_type_as_str.startswith("decimal"):
         return pa_type_as_str
 
-    # We have to take into account how arrow types map to parquet types as well.
-    # For example, null type maps to int32 in parquet, so we have to use int4 in Redshift.
-    # Other mappings have also been adjusted accordingly.
-    type_map = {
-        "null": "None",
-        "bool": "bit",
-        "int8": "tinyint",
-        "int16": "smallint",
-        "int32": "int",
-        "int64": "bigint",
-        "uint8": "tinyint",
-        "uint16": "smallint",
-        "uint32": "int",
-        "uint64": "bigint",
-        "float": "float",
-        "double": "real",
-        "binary": "binary",
-        "string": "varchar",
-    }
-
-    if pa_type_as_str.lower() not in type_map:
+    if pa_type_as_str not in PA_TYPE_STR_TO_MSSQL_TYPE:
         raise ValueError(f"MS SQL Server type not supported by feast {pa_type_as_str}")
 
-    return type_map[pa_type_as_str]
+    return PA_TYPE_STR_TO_MSSQL_TYPE[pa_type_as_str]
+
+
+# Type names from https://docs.aws.amazon.com/redshift/latest/dg/c_Supported_data_types.html
+REDSHIFT_TYPE_TO_FEAST_VALUE_TYPE: Dict[str, ValueType] = {
+    "int2": ValueType.INT32,
+    "int4": ValueType.INT32,
+    "int8": ValueType.INT64,
+    "numeric": ValueType.DOUBLE,
+    "float4": ValueType.FLOAT,
+    "float8": ValueType.DOUBLE,
+    "bool": ValueType.BOOL,
+    "character": ValueType.STRING,
+    "varchar": ValueType.STRING,
+    "timestamp": ValueType.UNIX_TIMESTAMP,
+    "timestamptz": ValueType.UNIX_TIMESTAMP,
+    "super": ValueType.BYTES,
+    # skip date, geometry, hllsketch, time, timetz
+}
 
 
 def redshift_to_feast_value_type(redshift_type_as_str: str) -> ValueType:
-    # Type names from https://docs.aws.amazon.com/redshift/latest/dg/c_Supported_data_types.html
-    type_map = {
-        "int2": ValueType.INT32,
-        "int4": ValueType.INT32,
-        "int8": ValueType.INT64,
-        "numeric": ValueType.DOUBLE,
-        "float4": ValueType.FLOAT,
-        "float8": ValueType.DOUBLE,
-        "bool": ValueType.BOOL,
-        "character": ValueType.STRING,
-        "varchar": ValueType.STRING,
-        "timestamp": ValueType.UNIX_TIMESTAMP,
-        "timestamptz": ValueType.UNIX_TIMESTAMP,
-        "super": ValueType.BYTES,
-        # skip date, geometry, hllsketch, time, timetz
-    }
-
-    return type_map[redshift_type_as_str.lower()]
+    return REDSHIFT_TYPE_TO_FEAST_VALUE_TYPE[redshift_type_as_str.lower()]
+
+
+SNOWFLAKE_TYPE_TO_FEAST_VALUE_TYPE: Dict[str, ValueType] = {
+    "BINARY": ValueType.BYTES,
+    "VARCHAR": ValueType.STRING,
+    "NUMBER32": ValueType.INT32,
+    "NUMBER64": ValueType.INT64,
+    "NUMBERwSCALE": ValueType.DOUBLE,
+    "DOUBLE": ValueType.DOUBLE,
+    "BOOLEAN": ValueType.BOOL,
+    "DATE": ValueType.UNIX_TIMESTAMP,
+    "TIMESTAMP": ValueType.UNIX_TIMESTAMP,
+    "TIMESTAMP_TZ": ValueType.UNIX_TIMESTAMP,
+    "TIMESTAMP_LTZ": ValueType.UNIX_TIMESTAMP,
+    "TIMESTAMP_NTZ": ValueType.UNIX_TIMESTAMP,
+}
 
 
 def snowflake_type_to_feast_value_type(snowflake_type: str) -> ValueType:
-    type_map = {
-        "BINARY": ValueType.BYTES,
-        "VARCHAR": ValueType.STRING,
-        "NUMBER32": ValueType.INT32,
-        "NUMBER64": ValueType.INT64,
-        "NUMBERwSCALE": ValueType.DOUBLE,
-        "DOUBLE": ValueType.DOUBLE,
-        "BOOLEAN": ValueType.BOOL,
-        "DATE": ValueType.UNIX_TIMESTAMP,
-        "TIMESTAMP": ValueType.UNIX_TIMESTAMP,
-        "TIMESTAMP_TZ": ValueType.UNIX_TIMESTAMP,
-        "TIMESTAMP_LTZ": ValueType.UNIX_TIMESTAMP,
-        "TIMESTAMP_NTZ": ValueType.UNIX_TIMESTAMP,
-    }
-    return type_map[snowflake_type]
+    return SNOWFLAKE_TYPE_TO_FEAST_VALUE_TYPE[snowflake_type]
 
 
 def _convert_value_name_to_snowflake_udf(value_name: str, project_name: str) -> str:
@@ -718,6 +738,27 @@ def _convert_value_name_to_snowflake_udf(value_name: str, project_name: str) ->
     return name_map[value_name].upper()
 
 
+# We have to take into account how arrow types map to parquet types as well.
+# For example, null type maps to int32 in parquet, so we have to use int4 in Redshift.
+# Other mappings have also been adjusted accordingly.
+PA_TYPE_STR_TO_REDSHIFT_TYPE: Dict[str, str] = {
+    "null": "int4",
+    "bool": "bool",
+    "int8": "int4",
+    "int16": "int4",
+    "int32": "int4",
+    "int64": "int8",
+    "uint8": "int4",
+    "uint16": "int4",
+    "uint32": "int8",
+    "uint64": "int8",
+    "float": "float4",
+    "double": "float8",
+    "binary": "varchar",
+    "string": "varchar",
+}
+
+
 def pa_to_redshift_value_type(pa_type: "pyarrow.DataType") -> str:
     # PyArrow types: https://arrow.apache.org/docs/python/api/datatypes.html
     # Redshift type: https://docs.aws.amazon.com/redshift/latest/dg/c_Supported_data_types.html
@@ -738,27 +779,7 @@ def pa_to_redshift_value_type(pa_type: "pyarrow.DataType") -> str:
     if pa_type_as_str.startswith("list"):
         return "super"
 
-    # We have to take into account how arrow types map to parquet types as well.
-    # For example, null type maps to int32 in parquet, so we have to use int4 in Redshift.
-    # Other mappings have also been adjusted accordingly.
-    type_map = {
-        "null": "int4",
-        "bool": "bool",
-        "int8": "int4",
-        "int16": "int4",
-        "int32": "int4",
-        "int64": "int8",
-        "uint8": "int4",
-        "uint16": "int4",
-        "uint32": "int8",
-        "uint64": "int8",
-        "float": "float4",
-        "double": "float8",
-        "binary": "varchar",
-        "string": "varchar",
-    }
-
-    return type_map[pa_type_as_str]
+    return PA_TYPE_STR_TO_REDSHIFT_TYPE[pa_type_as_str]
 
 
 def _non_empty_value(value: Any) -> bool:
@@ -773,32 +794,35 @@ def _non_empty_value(value: Any) -> bool:
     )
 
 
+# TODO not all spark types are convertible
+# Current non-convertible types: interval, map, struct, structfield, binary
+SPARK_TYPE_TO_FEAST_VALUE_TYPE: Dict[str, ValueType] = {
+    "null": ValueType.UNKNOWN,
+    "byte": ValueType.BYTES,
+    "string": ValueType.STRING,
+    "int": ValueType.INT32,
+    "short": ValueType.INT32,
+    "bigint": ValueType.INT64,
+    "long": ValueType.INT64,
+    "double": ValueType.DOUBLE,
+    "decimal": ValueType.DOUBLE,
+    "float": ValueType.FLOAT,
+    "boolean": ValueType.BOOL,
+    "timestamp": ValueType.UNIX_TIMESTAMP,
+    "array<byte>": ValueType.BYTES_LIST,
+    "array<string>": ValueType.STRING_LIST,
+    "array<int>": ValueType.INT32_LIST,
+    "array<bigint>": ValueType.INT64_LIST,
+    "array<double>": ValueType.DOUBLE_LIST,
+    "array<decimal>": ValueType.DOUBLE_LIST,
+    "array<float>": ValueType.FLOAT_LIST,
+    "array<boolean>": ValueType.BOOL_LIST,
+    "array<timestamp>": ValueType.UNIX_TIMESTAMP_LIST,
+}
+
+
 def spark_to_feast_value_type(spark_type_as_str: str) -> ValueType:
-    # TODO not all spark types are convertible
-    # Current non-convertible types: interval, map, struct, structfield, binary
-    type_map: Dict[str, ValueType] = {
-        "null": ValueType.UNKNOWN,
-        "byte": ValueType.BYTES,
-        "string": ValueType.STRING,
-        "int": ValueType.INT32,
-        "short": ValueType.INT32,
-        "bigint": ValueType.INT64,
-        "long": ValueType.INT64,
-        "double": ValueType.DOUBLE,
-        "decimal": ValueType.DOUBLE,
-        "float": ValueType.FLOAT,
-        "boolean": ValueType.BOOL,
-        "timestamp": ValueType.UNIX_TIMESTAMP,
-        "array<byte>": ValueType.BYTES_LIST,
-        "array<string>": ValueType.STRING_LIST,
-        "array<int>": ValueType.INT32_LIST,
-        "array<bigint>": ValueType.INT64_LIST,
-        "array<double>": ValueType.DOUBLE_LIST,
-        "array<decimal>": ValueType.DOUBLE_LIST,
-        "array<float>": ValueType.FLOAT_LIST,
-        "array<boolean>": ValueType.BOOL_LIST,
-        "array<timestamp>": ValueType.UNIX_TIMESTAMP_LIST,
-    }
+    type_map = SPARK_TYPE_TO_FEAST_VALUE_TYPE
     if spark_type_as_str.startswith("decimal"):
         spark_type_as_str = "decimal"
     if spark_type_as_str.startswith("array<decimal"):
@@ -829,81 +853,86 @@ def spark_schema_to_np_dtypes(dtypes: List[Tuple[str, str]]) -> Iterator[np.dtyp
     return (type_map[t] for _, t in dtypes)
 
 
+ARROW_TYPE_STR_TO_PG_TYPE: Dict[str, str] = {
+    "null": "null",
+    "bool": "boolean",
+    "int8": "tinyint",
+    "int16": "smallint",
+    "int32": "int",
+    "int64": "bigint",
+    "list<item: int32>": "int[]",
+    "list<item: int64>": "bigint[]",
+    "list<item: bool>": "boolean[]",
+    "list<item: double>": "double precision[]",
+    "list<item: timestamp[us]>": "timestamp[]",
+    "uint8": "smallint",
+    "uint16": "int",
+    "uint32": "bigint",
+    "uint64": "bigint",
+    "float": "float",
+    "double": "double precision",
+    "binary": "binary",
+    "string": "text",
+}
+
+
 def arrow_to_pg_type(t_str: str) -> str:
     try:
         if t_str.startswith("timestamp") or t_str.startswith("datetime"):
             return "timestamptz" if "tz=" in t_str else "timestamp"
-        return {
-            "null": "null",
-            "bool": "boolean",
-            "int8": "tinyint",
-            "int16": "smallint",
-            "int32": "int",
-            "int64": "bigint",
-            "list<item: int32>": "int[]",
-            "list<item: int64>": "bigint[]",
-            "list<item: bool>": "boolean[]",
-            "list<item: double>": "double precision[]",
-            "list<item: timestamp[us]>": "timestamp[]",
-            "uint8": "smallint",
-            "uint16": "int",
-            "uint32": "bigint",
-            "uint64": "bigint",
-            "float": "float",
-            "double": "double precision",
-            "binary": "binary",
-            "string": "text",
-        }[t_str]
+        return ARROW_TYPE_STR_TO_PG_TYPE[t_str]
     except KeyError:
         raise ValueError(f"Unsupported type: {t_str}")
 
 
+PG_TYPE_TO_FEAST_VALUE_TYPE: Dict[str, ValueType] = {
+    "boolean": ValueType.BOOL,
+    "bytea": ValueType.BYTES,
+    "char": ValueType.STRING,
+    "bigint": ValueType.INT64,
+    "smallint": ValueType.INT32,
+    "integer": ValueType.INT32,
+    "real": ValueType.DOUBLE,
+    "double precision": ValueType.DOUBLE,
+    "boolean[]": ValueType.BOOL_LIST,
+    "bytea[]": ValueType.BYTES_LIST,
+    "char[]": ValueType.STRING_LIST,
+    "smallint[]": ValueType.INT32_LIST,
+    "integer[]": ValueType.INT32_LIST,
+    "text": ValueType.STRING,
+    "text[]": ValueType.STRING_LIST,
+    "character[]": ValueType.STRING_LIST,
+    "bigint[]": ValueType.INT64_LIST,
+    "real[]": ValueType.DOUBLE_LIST,
+    "double precision[]": ValueType.DOUBLE_LIST,
+    "character": ValueType.STRING,
+    "character varying": ValueType.STRING,
+    "date": ValueType.UNIX_TIMESTAMP,
+    "time without time zone": ValueType.UNIX_TIMESTAMP,
+    "timestamp without time zone": ValueType.UNIX_TIMESTAMP,
+    "timestamp without time zone[]": ValueType.UNIX_TIMESTAMP_LIST,
+    "date[]": ValueType.UNIX_TIMESTAMP_LIST,
+    "time without time zone[]": ValueType.UNIX_TIMESTAMP_LIST,
+    "timestamp with time zone": ValueType.UNIX_TIMESTAMP,
+    "timestamp with time zone[]": ValueType.UNIX_TIMESTAMP_LIST,
+    "numeric[]": ValueType.DOUBLE_LIST,
+    "numeric": ValueType.DOUBLE,
+    "uuid": ValueType.STRING,
+    "uuid[]": ValueType.STRING_LIST,
+}
+
+
 def pg_type_to_feast_value_type(type_str: str) -> ValueType:
-    type_map: Dict[str, ValueType] = {
-        "boolean": ValueType.BOOL,
-        "bytea": ValueType.BYTES,
-        "char": ValueType.STRING,
-        "bigint": ValueType.INT64,
-        "smallint": ValueType.INT32,
-        "integer": ValueType.INT32,
-        "real": ValueType.DOUBLE,
-        "double precision": ValueType.DOUBLE,
-        "boolean[]": ValueType.BOOL_LIST,
-        "bytea[]": ValueType.BYTES_LIST,
-        "char[]": ValueType.STRING_LIST,
-        "smallint[]": ValueType.INT32_LIST,
-        "integer[]": ValueType.INT32_LIST,
-        "text": ValueType.STRING,
-        "text[]": ValueType.STRING_LIST,
-        "character[]": ValueType.STRING_LIST,
-        "bigint[]": ValueType.INT64_LIST,
-        "real[]": ValueType.DOUBLE_LIST,
-        "double precision[]": ValueType.DOUBLE_LIST,
-        "character": ValueType.STRING,
-        "character varying": ValueType.STRING,
-        "date": ValueType.UNIX_TIMESTAMP,
-        "time without time zone": ValueType.UNIX_TIMESTAMP,
-        "timestamp without time zone": ValueType.UNIX_TIMESTAMP,
-        "timestamp without time zone[]": ValueType.UNIX_TIMESTAMP_LIST,
-        "date[]": ValueType.UNIX_TIMESTAMP_LIST,
-        "time without time zone[]": ValueType.UNIX_TIMESTAMP_LIST,
-        "timestamp with time zone": ValueType.UNIX_TIMESTAMP,
-        "timestamp with time zone[]": ValueType.UNIX_TIMESTAMP_LIST,
-        "numeric[]": ValueType.DOUBLE_LIST,
-        "numeric": ValueType.DOUBLE,
-        "uuid": ValueType.STRING,
-        "uuid[]": ValueType.STRING_LIST,
-    }
-    value = (
-        type_map[type_str.lower()]
-        if type_str.lower() in type_map
-        else ValueType.UNKNOWN
-    )
+    value = PG_TYPE_TO_FEAST_VALUE_TYPE.get(type_str.lower(), ValueType.UNKNOWN)
     if value == ValueType.UNKNOWN:
         print("unknown type:", type_str)
     return value
 
 
+# Memoized because the table of pyarrow types cannot be built at import (pyarrow
+# is imported lazily) and callers convert the same handful of types repeatedly,
+# e.g. once per field when building a schema.
+@functools.lru_cache(maxsize=None)
 def feast_value_type_to_pa(
     feast_type: ValueType, timestamp_unit: str = "us"
 ) -> "pyarrow.DataType":
@@ -990,25 +1019,48 @@ def pg_type_code_to_arrow(code: int) -> str:
     )
 
 
+# Type names from https://docs.aws.amazon.com/athena/latest/ug/data-types.html
+ATHENA_TYPE_TO_FEAST_VALUE_TYPE: Dict[str, ValueType] = {
+    "null": ValueType.UNKNOWN,
+    "boolean": ValueType.BOOL,
+    "tinyint": ValueType.INT32,
+    "smallint": ValueType.INT32,
+    "int": ValueType.INT32,
+    "bigint": ValueType.INT64,
+    "double": ValueType.DOUBLE,
+    "float": ValueType.FLOAT,
+    "binary": ValueType.BYTES,
+    "char": ValueType.STRING,
+    "varchar": ValueType.STRING,
+    "string": ValueType.STRING,
+    "timestamp": ValueType.UNIX_TIMESTAMP,
+    # skip date,decimal,array,map,struct
+}
+
+
 def athena_to_feast_value_type(athena_type_as_str: str) -> ValueType:
-    # Type names from https://docs.aws.amazon.com/athena/latest/ug/data-types.html
-    type_map = {
-        "null": ValueType.UNKNOWN,
-        "boolean": ValueType.BOOL,
-        "tinyint": ValueType.INT32,
-        "smallint": ValueType.INT32,
-        "int": ValueType.INT32,
-        "bigint": ValueType.INT64,
-        "double": ValueType.DOUBLE,
-        "float": ValueType.FLOAT,
-        "binary": ValueType.BYTES,
-        "char": ValueType.STRING,
-        "varchar": ValueType.STRING,
-        "string": ValueType.STRING,
-        "timestamp": ValueType.UNIX_TIMESTAMP,
-        # skip date,decimal,array,map,struct
-    }
-    return type_map[athena_type_as_str.lower()]
+    return ATHENA_TYPE_TO_FEAST_VALUE_TYPE[athena_type_as_str.lower()]
+
+
+# We have to take into account how arrow types map to parquet types as well.
+# For example, null type maps to int32 in parquet, so we have to use int4 in Redshift.
+# Other mappings have also been adjusted accordingly.
+PA_TYPE_STR_TO_ATHENA_TYPE: Dict[str, str] = {
+    "null": "null",
+    "bool": "boolean",
+    "int8": "tinyint",
+    "int16": "smallint",
+    "int32": "int",
+    "int64": "bigint",
+    "uint8": "tinyint",
+    "uint16": "tinyint",
+    "uint32": "tinyint",
+    "uint64": "tinyint",
+    "float": "float",
+    "double": "double",
+    "binary": "binary",
+    "string": "string",
+}
 
 
 def pa_to_athena_value_type(pa_type: "pyarrow.DataType") -> str:
@@ -1024,24 +1076,4 @@ def pa_to_athena_value_type(pa_type: "pyarrow.DataType") -> str:
     if pa_type_as_str.startswith("python_values_to_proto_values"):
         return pa_type_as_str
 
-    # We have to take into account how arrow types map to parquet types as well.
-    # For example, null type maps to int32 in parquet, so we have to use int4 in Redshift.
-    # Other mappings have also been adjusted accordingly.
-    type_map = {
-        "null": "null",
-        "bool": "boolean",
-        "int8": "tinyint",
-        "int16": "smallint",
-        "int32": "int",
-        "int64": "bigint",
-        "uint8": "tinyint",
-        "uint16": "tinyint",
-        "uint32": "tinyint",
-        "uint64": "tinyint",
-        "float": "float",
-        "double": "double",
-        "binary": "binary",
-        "string": "string",
-    }
-
-    return type_map[pa_type_as_str]
+    return PA_TYPE_STR_TO_ATHENA_TYPE[pa_type_as_str]
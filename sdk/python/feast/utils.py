@@ -156,39 +156,26 @@ def _get_column_names(
     join_keys = [
         entity.join_key for entity in entities if entity.join_key != DUMMY_ENTITY_ID
     ]
-    if feature_view.batch_source.field_mapping is not None:
+    # Sources without a field mapping (the common case) can skip the reverse
+    # mapping entirely.
+    if feature_view.batch_source.field_mapping:
         reverse_field_mapping = {
             v: k for k, v in feature_view.batch_source.field_mapping.items()
         }
-        timestamp_field = (
-            reverse_field_mapping[timestamp_field]
-            if timestamp_field in reverse_field_mapping.keys()
-            else timestamp_field
-        )
-        created_timestamp_column = (
-            reverse_field_mapping[created_timestamp_column]
-            if created_timestamp_column
-            and created_timestamp_column in reverse_field_mapping.keys()
-            else created_timestamp_column
-        )
-        join_keys = [
-            reverse_field_mapping[col] if col in reverse_field_mapping.keys() else col
-            for col in join_keys
-        ]
-        feature_names = [
-            reverse_field_mapping[col] if col in reverse_field_mapping.keys() else col
-            for col in feature_names
-        ]
+        timestamp_field = reverse_field_mapping.get(timestamp_field, timestamp_field)
+        if created_timestamp_column:
+            created_timestamp_column = reverse_field_mapping.get(
+                created_timestamp_column, created_timestamp_column
+            )
+        join_keys = [reverse_field_mapping.get(col, col) for col in join_keys]
+        feature_names = [reverse_field_mapping.get(col, col) for col in feature_names]
 
     # We need to exclude join keys and timestamp columns from the list of features, after they are mapped to
     # their final column names via the `field_mapping` field of the source.
-    feature_names = [
-        name
-        for name in feature_names
-        if name not in join_keys
-        and name != timestamp_field
-        and name != created_timestamp_column
-    ]
+    non_feature_columns = set(join_keys)
+    non_feature_columns.add(timestamp_field)
+    non_feature_columns.add(created_timestamp_column)
+    feature_names = [name for name in feature_names if name not in non_feature_columns]
     return (
         join_keys,
         feature_names,
@@ -201,11 +188,11 @@ def _run_pyarrow_field_mapping(
     table: pyarrow.Table,
     field_mapping: Dict[str, str],
 ) -> pyarrow.Table:
+    if not field_mapping:
+        return table
+
     # run field mapping in the forward direction
-    cols = table.column_names
-    mapped_cols = [
-        field_mapping[col] if col in field_mapping.keys() else col for col in cols
-    ]
+    mapped_cols = [field_mapping.get(col, col) for col in table.column_names]
     table = table.rename_columns(mapped_cols)
     return table
 
@@ -42,6 +42,16 @@ def test_null_unix_timestamp_list():
         [0],
         [1],
     ),
+    ids=[
+        "np_true",
+        "np_false",
+        "np_0",
+        "np_1",
+        "list_true",
+        "list_false",
+        "list_0",
+        "list_1",
+    ],
 )
 def test_python_values_to_proto_values_bool(values):
     protos = python_values_to_proto_values(values, ValueType.BOOL)
@@ -70,6 +80,24 @@ def test_python_values_to_proto_values_bool(values):
         ([b"[1,0]"], ValueType.BOOL_LIST, [True, False]),
         ([None], ValueType.STRING_LIST, None),
     ),
+    ids=[
+        "np_int64_list",
+        "np_int32_list",
+        "np_float_list",
+        "np_double_list",
+        "np_string_list",
+        "np_bool_list",
+        "np_bool_list_from_ints",
+        "np_null_string_list",
+        "list_int64_list",
+        "list_int32_list",
+        "list_float_list",
+        "list_double_list",
+        "list_string_list",
+        "list_bool_list",
+        "list_bool_list_from_ints",
+        "list_null_string_list",
+    ],
 )
 def test_python_values_to_proto_values_bytes_to_list(values, value_type, expected):
     protos = python_values_to_proto_values(values, value_type)